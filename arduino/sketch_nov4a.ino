@@ -38,6 +38,9 @@ void loop() {
       Serial.println("M received, starting sequence...");
       moveMotorSequence();
       Serial.println("Sequence complete.");
+    } else if (command == '?') {
+      // Ready query from the PC scripts (sent right after opening the port)
+      Serial.println("READY");
     }
   }
 }
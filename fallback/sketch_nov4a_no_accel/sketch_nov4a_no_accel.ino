@@ -33,6 +33,9 @@ void loop() {
       Serial.println("M received, starting sequence..."); // Send log to PC
       moveMotorSequence();
       Serial.println("Sequence complete."); // Report completion
+    } else if (command == '?') {
+      // Ready query from the PC scripts (sent right after opening the port)
+      Serial.println("READY");
     }
   }
 }
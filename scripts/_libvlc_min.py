@@ -0,0 +1,143 @@
+"""Minimal ctypes bindings for the parts of libvlc used by the show controller.
+
+``play_and_eject.py`` only needs to create a player, play one file, and hear
+about a few player events. Binding those exports directly avoids importing
+python-vlc, which generates wrappers for the whole libvlc API at import time.
+
+Only libvlc 3.x (the VLC 3 desktop releases) is supported. The VLC install
+must match the bitness of the Python interpreter.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+from typing import Iterator
+
+# Opaque libvlc handles are passed around as plain pointer values.
+Instance = int
+Media = int
+MediaPlayer = int
+EventManager = int
+
+# libvlc_state_t
+STATE_NOTHING_SPECIAL = 0
+STATE_OPENING = 1
+STATE_BUFFERING = 2
+STATE_PLAYING = 3
+STATE_PAUSED = 4
+STATE_STOPPED = 5
+STATE_ENDED = 6
+STATE_ERROR = 7
+STATE_NAMES = (
+    "NothingSpecial",
+    "Opening",
+    "Buffering",
+    "Playing",
+    "Paused",
+    "Stopped",
+    "Ended",
+    "Error",
+)
+
+# libvlc_event_e (media player events)
+EVENT_PLAYER_PLAYING = 0x104
+EVENT_PLAYER_STOPPED = 0x106
+EVENT_PLAYER_END_REACHED = 0x109
+EVENT_PLAYER_ENCOUNTERED_ERROR = 0x10A
+
+# libvlc_media_parse_flag_t / libvlc_media_parsed_status_t
+MEDIA_PARSE_LOCAL = 0x00
+MEDIA_PARSED_STATUS_SKIPPED = 1
+MEDIA_PARSED_STATUS_FAILED = 2
+MEDIA_PARSED_STATUS_TIMEOUT = 3
+MEDIA_PARSED_STATUS_DONE = 4
+
+# void (*libvlc_callback_t)(const libvlc_event_t *event, void *user_data)
+Callback = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p)
+
+
+def _vlc_install_dirs() -> Iterator[str]:
+    """Yield directories that may contain ``libvlc.dll``."""
+
+    try:
+        import winreg
+
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\VideoLAN\VLC") as key:
+            yield winreg.QueryValueEx(key, "InstallDir")[0]
+    except (ImportError, OSError):
+        pass
+
+    for env_var in ("ProgramFiles", "ProgramFiles(x86)"):
+        root = os.environ.get(env_var)
+        if root:
+            yield os.path.join(root, "VideoLAN", "VLC")
+
+
+def _load_libvlc() -> ctypes.CDLL:
+    """Load libvlc from ``PYTHON_VLC_LIB_PATH``, the VLC install, or the PATH."""
+
+    override = os.environ.get("PYTHON_VLC_LIB_PATH")
+    if override:
+        return ctypes.CDLL(override)
+
+    for directory in _vlc_install_dirs():
+        dll_path = os.path.join(directory, "libvlc.dll")
+        if os.path.isfile(dll_path):
+            # A full path also lets Windows find libvlccore.dll next to it.
+            return ctypes.CDLL(dll_path)
+
+    # A bare "libvlc.dll" would not search PATH on Python 3.8+, so resolve the
+    # full path first (find_library walks PATH on Windows).
+    dll_path = ctypes.util.find_library("libvlc")
+    if dll_path is None:
+        raise OSError(
+            "Could not find libvlc.dll. Install VLC Media Player (matching the "
+            "Python bitness) or set PYTHON_VLC_LIB_PATH to libvlc.dll."
+        )
+    # Absolute, so Windows also searches its folder for libvlccore.dll.
+    return ctypes.CDLL(os.path.abspath(dll_path))
+
+
+def _bind(name: str, restype, *argtypes):
+    """Return the libvlc export ``name`` with its prototype declared."""
+
+    func = getattr(_libvlc, name)
+    func.argtypes = list(argtypes)
+    func.restype = restype
+    return func
+
+
+_libvlc = _load_libvlc()
+
+_p = ctypes.c_void_p
+
+new = _bind("libvlc_new", _p, ctypes.c_int, ctypes.POINTER(ctypes.c_char_p))
+release = _bind("libvlc_release", None, _p)
+
+_media_new_path = _bind("libvlc_media_new_path", _p, _p, ctypes.c_char_p)
+media_release = _bind("libvlc_media_release", None, _p)
+media_parse_with_options = _bind(
+    "libvlc_media_parse_with_options", ctypes.c_int, _p, ctypes.c_int, ctypes.c_int
+)
+media_get_parsed_status = _bind("libvlc_media_get_parsed_status", ctypes.c_int, _p)
+
+media_player_new_from_media = _bind("libvlc_media_player_new_from_media", _p, _p)
+media_player_release = _bind("libvlc_media_player_release", None, _p)
+media_player_play = _bind("libvlc_media_player_play", ctypes.c_int, _p)
+media_player_stop = _bind("libvlc_media_player_stop", None, _p)
+media_player_get_state = _bind("libvlc_media_player_get_state", ctypes.c_int, _p)
+media_player_get_length = _bind("libvlc_media_player_get_length", ctypes.c_int64, _p)
+media_player_get_time = _bind("libvlc_media_player_get_time", ctypes.c_int64, _p)
+media_player_event_manager = _bind("libvlc_media_player_event_manager", _p, _p)
+set_fullscreen = _bind("libvlc_set_fullscreen", None, _p, ctypes.c_int)
+
+event_attach = _bind("libvlc_event_attach", ctypes.c_int, _p, ctypes.c_int, Callback, _p)
+event_detach = _bind("libvlc_event_detach", None, _p, ctypes.c_int, Callback, _p)
+
+
+def media_new_path(instance: Instance, path: str) -> Media:
+    """Create a media for the local file ``path`` (libvlc expects UTF-8)."""
+
+    return _media_new_path(instance, path.encode("utf-8"))
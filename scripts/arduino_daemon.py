@@ -0,0 +1,220 @@
+"""Keep the Arduino serial port open and forward commands from a named pipe.
+
+Every script that opens the serial port itself pays for port detection and,
+on boards that still auto-reset, up to two seconds of bootloader wait. Start
+this helper once before a session; `send_arduino_command.py` and
+`play_and_eject.py` then hand their commands to it through the named pipe
+``\\\\.\\pipe\\arduino-show-ctrl`` and fall back to the serial port only when
+the daemon is not running.
+
+Usage examples:
+  python scripts/arduino_daemon.py
+  python scripts/arduino_daemon.py --port COM3
+
+Close the window to stop the daemon and release the port.
+
+Prerequisites
+-------------
+pip install pyserial
+"""
+
+from __future__ import annotations
+
+import argparse
+import ctypes
+import functools
+import sys
+from ctypes import wintypes
+from typing import Optional
+
+import serial
+
+from send_arduino_command import (
+    DAEMON_PIPE_PATH,
+    DEFAULT_BAUDRATE,
+    DEFAULT_TIMEOUT,
+    connect_to_arduino,
+    connect_to_detected_arduino,
+)
+
+PIPE_ACCESS_INBOUND = 0x00000001
+PIPE_TYPE_BYTE = 0x00000000
+PIPE_READMODE_BYTE = 0x00000000
+PIPE_WAIT = 0x00000000
+PIPE_REJECT_REMOTE_CLIENTS = 0x00000008
+# One instance serves a client while the next one is already listening.
+PIPE_MAX_INSTANCES = 2
+PIPE_BUFFER_SIZE = 64
+ERROR_NO_DATA = 232
+ERROR_PIPE_CONNECTED = 535
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+if sys.platform == "win32":
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _CreateNamedPipeW = _kernel32.CreateNamedPipeW
+    _CreateNamedPipeW.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.LPVOID,
+    ]
+    _CreateNamedPipeW.restype = wintypes.HANDLE
+
+    _ConnectNamedPipe = _kernel32.ConnectNamedPipe
+    _ConnectNamedPipe.argtypes = [wintypes.HANDLE, wintypes.LPVOID]
+    _ConnectNamedPipe.restype = wintypes.BOOL
+
+    _ReadFile = _kernel32.ReadFile
+    _ReadFile.argtypes = [
+        wintypes.HANDLE,
+        wintypes.LPVOID,
+        wintypes.DWORD,
+        wintypes.LPDWORD,
+        wintypes.LPVOID,
+    ]
+    _ReadFile.restype = wintypes.BOOL
+
+    _DisconnectNamedPipe = _kernel32.DisconnectNamedPipe
+    _DisconnectNamedPipe.argtypes = [wintypes.HANDLE]
+    _DisconnectNamedPipe.restype = wintypes.BOOL
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+
+
+def create_pipe_instance() -> int:
+    """Create one inbound, byte-mode instance of the daemon's named pipe."""
+
+    handle = _CreateNamedPipeW(
+        DAEMON_PIPE_PATH,
+        PIPE_ACCESS_INBOUND,
+        PIPE_TYPE_BYTE | PIPE_READMODE_BYTE | PIPE_WAIT | PIPE_REJECT_REMOTE_CLIENTS,
+        PIPE_MAX_INSTANCES,
+        0,
+        PIPE_BUFFER_SIZE,
+        0,
+        None,
+    )
+    if handle == INVALID_HANDLE_VALUE:
+        raise OSError(f"CreateNamedPipe failed (error {ctypes.get_last_error()})")
+    return handle
+
+
+def forward_client(pipe: int, arduino: serial.Serial) -> None:
+    """Copy everything one client writes to the pipe onto the serial port."""
+
+    buffer = ctypes.create_string_buffer(PIPE_BUFFER_SIZE)
+    bytes_read = wintypes.DWORD()
+    # ReadFile fails with ERROR_BROKEN_PIPE once the client has disconnected.
+    while _ReadFile(pipe, buffer, PIPE_BUFFER_SIZE, ctypes.byref(bytes_read), None):
+        if bytes_read.value:
+            data = buffer.raw[: bytes_read.value]
+            arduino.write(data)
+            print(f"Forwarded {data!r} to Arduino.")
+
+
+def _reopen_serial(arduino: serial.Serial) -> None:
+    """Reopen the serial port after an error; the next client retries on failure."""
+
+    arduino.close()
+    try:
+        arduino.open()  # Keeps the settings (including DTR low) from the first open
+    except serial.SerialException as exc:
+        print(f"Could not reopen {arduino.port}: {exc}")
+    else:
+        print(f"Reopened {arduino.port}.")
+
+
+def serve(arduino: serial.Serial) -> None:
+    """Accept pipe clients one at a time and forward their commands forever."""
+
+    print(f"Listening on {DAEMON_PIPE_PATH}")
+    listening = create_pipe_instance()
+    while True:
+        # A client may connect (or even write and close) before we get here;
+        # its data is still buffered in the pipe, so serve it either way.
+        connected = _ConnectNamedPipe(listening, None) or ctypes.get_last_error() in (
+            ERROR_PIPE_CONNECTED,
+            ERROR_NO_DATA,
+        )
+        if not connected:
+            _CloseHandle(listening)
+            listening = create_pipe_instance()
+            continue
+
+        # Open the next instance before serving this client so the pipe name
+        # never disappears (clients would otherwise fall back to the COM port).
+        pipe, listening = listening, create_pipe_instance()
+        try:
+            if not arduino.is_open:
+                _reopen_serial(arduino)
+            forward_client(pipe, arduino)
+        except serial.SerialException as exc:  # Includes write timeouts
+            # Drop this client's command but keep serving the next ones.
+            print(f"Serial error while forwarding: {exc}")
+            _reopen_serial(arduino)
+        finally:
+            _DisconnectNamedPipe(pipe)
+            _CloseHandle(pipe)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI for the daemon."""
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Keep the Arduino serial port open and forward commands from a named pipe."
+        )
+    )
+    parser.add_argument(
+        "--port",
+        help="Explicit COM port to use (e.g. COM3). If omitted, auto-detect by name.",
+    )
+    parser.add_argument(
+        "--baudrate",
+        type=int,
+        default=DEFAULT_BAUDRATE,
+        help=f"Serial baud rate (default: {DEFAULT_BAUDRATE}).",
+    )
+
+    return parser
+
+
+def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse the daemon's command line."""
+
+    return _build_parser().parse_args(argv)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Entry point for the daemon."""
+
+    if sys.platform != "win32":
+        raise SystemExit("This daemon relies on Windows named pipes.")
+
+    args = parse_arguments(argv)
+
+    connection: Optional[serial.Serial] = None
+    try:
+        if args.port:
+            connection = connect_to_arduino(args.port, args.baudrate, DEFAULT_TIMEOUT)
+        else:
+            connection = connect_to_detected_arduino(args.baudrate, DEFAULT_TIMEOUT)
+        if connection is None:
+            raise SystemExit("Aborting: no Arduino port could be determined.")
+        serve(connection)
+    finally:
+        if connection is not None and connection.is_open:
+            print("Closing serial connection...")
+            connection.close()
+
+
+if __name__ == "__main__":
+    main()
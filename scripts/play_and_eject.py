@@ -3,24 +3,48 @@
 This is the primary show controller script (Windows). It plays a video in VLC,
 waits for it to complete, then ejects the DVD tray and triggers an Arduino motor.
 
+Port detection and the serial handshake are shared with
+scripts/send_arduino_command.py. If scripts/arduino_daemon.py is running, the
+motor command is sent through its named pipe instead of opening the serial
+port here.
+
 Prerequisites:
-  pip install python-vlc pyserial
-  Install VLC Media Player on the machine.
+  pip install pyserial
+  Install VLC Media Player on the machine (libvlc is loaded via ctypes).
 """
 
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
 import ctypes
+import functools
+import json
 import os
+import stat
 import sys
+import threading
 import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import wintypes
 from dataclasses import dataclass
-from typing import Optional, Sequence, Tuple
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
 
 import serial
-import serial.tools.list_ports
-import vlc
+
+import _libvlc_min as libvlc
+from send_arduino_command import (
+    CACHE_DIR,
+    DAEMON_PIPE_PATH,
+    DEFAULT_BAUDRATE,
+    DEFAULT_TIMEOUT,
+    connect_to_arduino as open_arduino_connection,
+    connect_to_detected_arduino,
+    send_command,
+    send_via_daemon,
+)
 
 # ---------------------------------------------------------------------------
 # Configuration defaults
@@ -29,8 +53,177 @@ IOCTL_STORAGE_EJECT_MEDIA = 0x2D4808
 DEFAULT_VIDEO_FILE_PATH = "D:\\video.mp4"
 DEFAULT_MARGIN_SECONDS = 10.0
 DEFAULT_EJECT_WAIT_SECONDS = 5.0
-POLL_INTERVAL_SECONDS = 5.0
-ARDUINO_KEYWORDS = ("Arduino", "CH340", "USB-SERIAL")
+END_WAIT_MARGIN_SECONDS = 5.0
+MEDIA_PARSE_TIMEOUT_MS = 2000
+MEDIA_PARSE_POLL_SECONDS = 0.01
+PLAYBACK_START_TIMEOUT_SECONDS = 2.0
+WAVE_EXTENSIONS = (".wav",)
+MOTOR_CMD = b"M\n"
+SHOW_CACHE_FILE = os.path.join(CACHE_DIR, "cache.json")
+
+# Whether the MCI alias is open; it is only closed when the process exits.
+_mci_alias_opened = False
+
+# Overlapped eject IOCTL still in flight; completed by :func:`wait_for_tray`.
+_pending_eject: Optional[_PendingEject] = None
+
+# ---------------------------------------------------------------------------
+# Win32 bindings
+# ---------------------------------------------------------------------------
+GENERIC_READ = 0x80000000
+FILE_SHARE_READ = 0x00000001
+FILE_SHARE_WRITE = 0x00000002
+OPEN_EXISTING = 3
+FILE_FLAG_OVERLAPPED = 0x40000000
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+ERROR_IO_PENDING = 997
+IOCTL_EJECT_TIMEOUT_MS = 30_000
+ERROR_FILE_NOT_FOUND = 2
+NMPWAIT_NOWAIT = 0x00000001
+MCI_ALIAS = "cd"
+_MCI_OPEN = f"open cdaudio alias {MCI_ALIAS}"
+_MCI_DOOR = f"set {MCI_ALIAS} door open"
+_MCI_CLOSE = f"close {MCI_ALIAS}"
+TIMER_RESOLUTION_MS = 1
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x001F0003
+WAIT_OBJECT_0 = 0
+WAIT_TIMEOUT = 0x00000102
+# Wake up this often while waiting so Ctrl+C is still handled promptly.
+WAIT_SLICE_MS = 100
+
+
+class OVERLAPPED(ctypes.Structure):
+    """Win32 ``OVERLAPPED`` (the Offset/Pointer union is spelled as offsets)."""
+
+    _fields_ = [
+        ("Internal", ctypes.c_size_t),
+        ("InternalHigh", ctypes.c_size_t),
+        ("Offset", wintypes.DWORD),
+        ("OffsetHigh", wintypes.DWORD),
+        ("hEvent", wintypes.HANDLE),
+    ]
+
+
+if sys.platform == "win32":
+    # Explicit prototypes keep 64-bit HANDLEs intact (the ctypes default is a
+    # 32-bit int) and let ctypes convert arguments without guessing.
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    _CreateFileW = _kernel32.CreateFileW
+    _CreateFileW.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.LPVOID,
+        wintypes.DWORD,
+        wintypes.DWORD,
+        wintypes.HANDLE,
+    ]
+    _CreateFileW.restype = wintypes.HANDLE
+
+    _DeviceIoControl = _kernel32.DeviceIoControl
+    _DeviceIoControl.argtypes = [
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        wintypes.LPVOID,
+        wintypes.DWORD,
+        wintypes.LPVOID,
+        wintypes.DWORD,
+        wintypes.LPDWORD,
+        wintypes.LPVOID,
+    ]
+    _DeviceIoControl.restype = wintypes.BOOL
+
+    _CreateEventW = _kernel32.CreateEventW
+    _CreateEventW.argtypes = [
+        wintypes.LPVOID,
+        wintypes.BOOL,
+        wintypes.BOOL,
+        wintypes.LPCWSTR,
+    ]
+    _CreateEventW.restype = wintypes.HANDLE
+
+    _GetOverlappedResult = _kernel32.GetOverlappedResult
+    _GetOverlappedResult.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(OVERLAPPED),
+        wintypes.LPDWORD,
+        wintypes.BOOL,
+    ]
+    _GetOverlappedResult.restype = wintypes.BOOL
+
+    _CancelIoEx = _kernel32.CancelIoEx
+    _CancelIoEx.argtypes = [wintypes.HANDLE, ctypes.POINTER(OVERLAPPED)]
+    _CancelIoEx.restype = wintypes.BOOL
+
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+
+    _CreateWaitableTimerExW = _kernel32.CreateWaitableTimerExW
+    _CreateWaitableTimerExW.argtypes = [
+        wintypes.LPVOID,
+        wintypes.LPCWSTR,
+        wintypes.DWORD,
+        wintypes.DWORD,
+    ]
+    _CreateWaitableTimerExW.restype = wintypes.HANDLE
+
+    _SetWaitableTimer = _kernel32.SetWaitableTimer
+    _SetWaitableTimer.argtypes = [
+        wintypes.HANDLE,
+        ctypes.POINTER(wintypes.LARGE_INTEGER),
+        wintypes.LONG,
+        wintypes.LPVOID,
+        wintypes.LPVOID,
+        wintypes.BOOL,
+    ]
+    _SetWaitableTimer.restype = wintypes.BOOL
+
+    _WaitForSingleObject = _kernel32.WaitForSingleObject
+    _WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    _WaitForSingleObject.restype = wintypes.DWORD
+
+    _WaitNamedPipeW = _kernel32.WaitNamedPipeW
+    _WaitNamedPipeW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD]
+    _WaitNamedPipeW.restype = wintypes.BOOL
+
+    _winmm = ctypes.WinDLL("winmm")
+
+    _timeBeginPeriod = _winmm.timeBeginPeriod
+    _timeBeginPeriod.argtypes = [wintypes.UINT]
+    _timeBeginPeriod.restype = wintypes.UINT
+
+    _timeEndPeriod = _winmm.timeEndPeriod
+    _timeEndPeriod.argtypes = [wintypes.UINT]
+    _timeEndPeriod.restype = wintypes.UINT
+
+    _mciSendString = _winmm.mciSendStringW
+    _mciSendString.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.LPWSTR,
+        wintypes.UINT,
+        wintypes.HANDLE,
+    ]
+    _mciSendString.restype = wintypes.DWORD
+
+
+@dataclass
+class _PendingEject:
+    """An eject IOCTL issued with overlapped I/O that has not completed yet.
+
+    The OVERLAPPED block and byte counter are written by the driver, so they
+    must stay alive until the request finishes.
+    """
+
+    drive_letter: str
+    handle: int
+    event: int
+    overlapped: OVERLAPPED
+    bytes_returned: wintypes.DWORD
+    # Issued from the cached preference, so MCI has not been tried yet.
+    from_cache: bool = False
 
 
 @dataclass
@@ -44,8 +237,9 @@ class ControllerConfig:
     arduino_port: Optional[str] = None
 
 
-def parse_arguments(argv: Optional[Sequence[str]] = None) -> ControllerConfig:
-    """Parse CLI arguments and return a :class:`ControllerConfig`."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Return the CLI parser, built on first use and cached afterwards."""
 
     parser = argparse.ArgumentParser(
         description="Play a video, eject the DVD tray, and trigger an Arduino motor."
@@ -77,11 +271,16 @@ def parse_arguments(argv: Optional[Sequence[str]] = None) -> ControllerConfig:
         help="Optional explicit COM port for the Arduino (e.g. COM3).",
     )
 
-    args = parser.parse_args(argv)
-    video_path = os.path.abspath(args.video)
+    return parser
+
+
+def parse_arguments(argv: Optional[Sequence[str]] = None) -> ControllerConfig:
+    """Parse CLI arguments and return a :class:`ControllerConfig`."""
+
+    args = _build_parser().parse_args(argv)
 
     return ControllerConfig(
-        video_path=video_path,
+        video_path=args.video,
         margin_seconds=args.margin,
         eject_wait_seconds=args.eject_wait,
         dry_run=args.dry_run,
@@ -89,96 +288,268 @@ def parse_arguments(argv: Optional[Sequence[str]] = None) -> ControllerConfig:
     )
 
 
-def find_arduino_port(preferred_port: Optional[str] = None) -> Optional[str]:
-    """Return the COM port that most likely hosts the Arduino board."""
+def daemon_is_running() -> bool:
+    """Return True if ``arduino_daemon.py`` is serving its named pipe.
+
+    WaitNamedPipe does not consume a pipe connection, unlike opening it.
+    """
+
+    if _WaitNamedPipeW(DAEMON_PIPE_PATH, NMPWAIT_NOWAIT):
+        return True
+    return ctypes.get_last_error() != ERROR_FILE_NOT_FOUND  # Busy still means running
+
+
+def _open_arduino(preferred_port: Optional[str] = None) -> serial.Serial:
+    """Find the Arduino (unless ``preferred_port`` is given) and open it directly."""
 
     if preferred_port:
         print(f"Using provided Arduino port: {preferred_port}")
-        return preferred_port
-
-    print("Searching for Arduino port...")
-    ports = serial.tools.list_ports.comports()
-    for port in ports:
-        if any(keyword in port.description for keyword in ARDUINO_KEYWORDS):
-            print(f"Found Arduino at: {port.device}")
-            return port.device
-    return None
+        return open_arduino_connection(preferred_port, DEFAULT_BAUDRATE, DEFAULT_TIMEOUT)
 
+    connection = connect_to_detected_arduino(DEFAULT_BAUDRATE, DEFAULT_TIMEOUT)
+    if connection is None:
+        raise RuntimeError("Could not find Arduino. Please check the USB connection.")
+    return connection
 
-def connect_to_arduino(preferred_port: Optional[str] = None) -> serial.Serial:
-    """Open a serial connection to the Arduino, waiting briefly for reset."""
 
-    port = find_arduino_port(preferred_port)
-    if port is None:
-        raise RuntimeError("Could not find Arduino. Please check the USB connection.")
+def connect_to_arduino(preferred_port: Optional[str] = None) -> Optional[serial.Serial]:
+    """Open a serial connection to the Arduino and wait until it is ready.
 
-    print(f"Connecting to Arduino on {port}...")
-    connection = serial.Serial(port=port, baudrate=9600, timeout=0.1)
-    time.sleep(2)  # Allow the Arduino bootloader to finish resetting
-    return connection
+    Returns None when ``arduino_daemon.py`` already holds the port; commands
+    are then sent through its pipe by :func:`trigger_arduino_motor`.
+    """
+
+    if daemon_is_running():
+        print("Arduino daemon is running; commands will be sent through it.")
+        return None
+
+    return _open_arduino(preferred_port)
 
 
 def ensure_video_exists(video_path: str) -> str:
-    """Verify that the requested video can be found on disk."""
+    """Verify that the requested video exists and return its absolute path."""
 
-    if not os.path.exists(video_path):
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise FileNotFoundError(f"Video file not found: {video_path}")
-    return video_path
+    return os.path.abspath(video_path)  # String-only on Windows (no file access)
+
+
+@contextlib.contextmanager
+def _player_events(
+    player: libvlc.MediaPlayer, event_types: Iterable[int]
+) -> Iterator[threading.Event]:
+    """Yield an event that is set whenever one of ``event_types`` fires."""
+
+    fired = threading.Event()
+    # Keep the ctypes callback referenced until it has been detached again.
+    callback = libvlc.Callback(lambda _event, _user_data: fired.set())
+    manager = libvlc.media_player_event_manager(player)
+    event_types = tuple(event_types)
+    for event_type in event_types:
+        libvlc.event_attach(manager, event_type, callback, None)
+    try:
+        yield fired
+    finally:
+        for event_type in event_types:
+            libvlc.event_detach(manager, event_type, callback, None)
 
 
-def start_video_playback(video_path: str) -> Tuple[vlc.Instance, vlc.MediaPlayer]:
+def start_video_playback(
+    video_path: str,
+) -> Tuple[libvlc.Instance, libvlc.MediaPlayer]:
     """Initialise VLC, play the requested video, and validate startup success."""
 
-    ensure_video_exists(video_path)
-    print("File found. Initializing VLC...")
-
-    instance = vlc.Instance()
-    player = instance.media_player_new()
-    media = instance.media_new(video_path)
-    player.set_media(media)
-    player.set_fullscreen(True)
+    print("Initializing VLC...")
 
-    print("Starting video playback...")
-    player.play()
-    time.sleep(1)  # Give VLC a moment to begin playback
+    instance = libvlc.new(0, None)
+    if not instance:
+        raise RuntimeError("libvlc could not be initialised.")
 
-    state = player.get_state()
-    if state in (vlc.State.Error, vlc.State.Ended, vlc.State.Stopped):
-        raise RuntimeError(f"VLC failed to start playback. State: {state}")
+    player = None
+    try:
+        media = libvlc.media_new_path(instance, video_path)
+        if not media:
+            raise RuntimeError(f"VLC could not open: {video_path}")
+
+        # Parse the file up front so play() does not have to demux it first.
+        # A rejected request (-1) never updates the status, so skip the wait.
+        if (
+            libvlc.media_parse_with_options(
+                media, libvlc.MEDIA_PARSE_LOCAL, MEDIA_PARSE_TIMEOUT_MS
+            )
+            == 0
+        ):
+            parse_deadline = time.monotonic() + MEDIA_PARSE_TIMEOUT_MS / 1000
+            while (
+                libvlc.media_get_parsed_status(media)
+                < libvlc.MEDIA_PARSED_STATUS_SKIPPED
+                and time.monotonic() < parse_deadline
+            ):
+                time.sleep(MEDIA_PARSE_POLL_SECONDS)
+
+        player = libvlc.media_player_new_from_media(media)
+        libvlc.media_release(media)  # The player holds its own reference
+        if not player:
+            raise RuntimeError("VLC could not create a media player.")
+        libvlc.set_fullscreen(player, True)
+
+        # Wake up as soon as VLC reports the first frame (or a failure) instead
+        # of sleeping for a fixed second.
+        start_events = (
+            libvlc.EVENT_PLAYER_PLAYING,
+            libvlc.EVENT_PLAYER_ENCOUNTERED_ERROR,
+            libvlc.EVENT_PLAYER_END_REACHED,
+        )
+        print("Starting video playback...")
+        with _player_events(player, start_events) as started:
+            libvlc.media_player_play(player)
+            started.wait(PLAYBACK_START_TIMEOUT_SECONDS)
+
+        state = libvlc.media_player_get_state(player)
+        if state in (libvlc.STATE_ERROR, libvlc.STATE_ENDED, libvlc.STATE_STOPPED):
+            raise RuntimeError(
+                f"VLC failed to start playback. State: {libvlc.STATE_NAMES[state]}"
+            )
+    except Exception:
+        release_video_playback(instance, player)
+        raise
 
     return instance, player
 
 
+def release_video_playback(
+    instance: libvlc.Instance, player: Optional[libvlc.MediaPlayer]
+) -> None:
+    """Stop playback and free the libvlc player and instance."""
+
+    if player:
+        libvlc.media_player_stop(player)
+        libvlc.media_player_release(player)
+    libvlc.release(instance)
+
+
 def wait_until_video_finishes(
-    player: vlc.MediaPlayer, poll_interval: float = POLL_INTERVAL_SECONDS
+    player: libvlc.MediaPlayer, margin_seconds: float = END_WAIT_MARGIN_SECONDS
 ) -> None:
     """Block until VLC reports that the video has finished playing."""
 
-    print("Video is playing... (checking state periodically)")
-    state = player.get_state()
-    while state not in (vlc.State.Ended, vlc.State.Stopped, vlc.State.Error):
-        time.sleep(poll_interval)
-        state = player.get_state()
+    print("Video is playing... (waiting for VLC to report the end)")
+    finished_states = (libvlc.STATE_ENDED, libvlc.STATE_STOPPED, libvlc.STATE_ERROR)
+    finished_events = (
+        libvlc.EVENT_PLAYER_END_REACHED,
+        libvlc.EVENT_PLAYER_ENCOUNTERED_ERROR,
+        libvlc.EVENT_PLAYER_STOPPED,
+    )
 
-    if state == vlc.State.Error:
+    with _player_events(player, finished_events) as finished:
+        # The callbacks only fire on transitions, so re-check the state on every
+        # wake-up (or after remaining length + margin) in case one slipped past.
+        while True:
+            finished.clear()
+            state = libvlc.media_player_get_state(player)
+            if state in finished_states:
+                break
+            remaining_ms = max(
+                libvlc.media_player_get_length(player)
+                - libvlc.media_player_get_time(player),
+                0,
+            )
+            finished.wait(remaining_ms / 1000 + margin_seconds)
+
+    if state == libvlc.STATE_ERROR:
         raise RuntimeError("Video playback ended with an error.")
 
     print("Video playback finished.")
 
 
-def open_tray_mci(alias: str = "cd") -> bool:
-    """Attempt to open the tray using the Windows MCI API."""
+def get_wave_duration(path: str) -> Optional[float]:
+    """Return the length of a PCM WAV file in seconds, or None for anything else.
+
+    Only files that winsound can play natively qualify; everything else
+    (including WAV codecs the ``wave`` module cannot read) goes through VLC.
+    """
 
+    if not path.lower().endswith(WAVE_EXTENSIONS):
+        return None
     try:
-        rc = ctypes.windll.winmm.mciSendStringW(
-            f"open cdaudio alias {alias}", None, 0, None
-        )
-        if rc != 0:
-            print(f"MCI open reported error code: {rc}")
-            return False
+        with wave.open(path, "rb") as wav:
+            return wav.getnframes() / wav.getframerate()
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def start_wave_playback(path: str) -> None:
+    """Start playing a WAV file in the background with winsound."""
+
+    import winsound
+
+    print("Starting audio playback (winsound)...")
+    winsound.PlaySound(
+        path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT
+    )
+
+
+def stop_wave_playback() -> None:
+    """Stop any sound started by :func:`start_wave_playback`."""
+
+    import winsound
+
+    winsound.PlaySound(None, 0)
+
+
+def _precise_sleep(seconds: float) -> None:
+    """Sleep for ``seconds`` on a high-resolution waitable timer."""
+
+    if seconds <= 0:
+        return
+
+    deadline = time.monotonic() + seconds
+    timer = _CreateWaitableTimerExW(
+        None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, TIMER_ALL_ACCESS
+    )
+    if not timer:  # High-resolution timers need Windows 10 1803 or newer
+        time.sleep(seconds)
+        return
+
+    try:
+        due = wintypes.LARGE_INTEGER(-int(seconds * 10_000_000))  # Relative, 100 ns units
+        if not _SetWaitableTimer(timer, ctypes.byref(due), 0, None, None, False):
+            time.sleep(seconds)
+            return
+        status = _WaitForSingleObject(timer, WAIT_SLICE_MS)
+        while status == WAIT_TIMEOUT:
+            status = _WaitForSingleObject(timer, WAIT_SLICE_MS)
+        if status != WAIT_OBJECT_0:  # WAIT_FAILED: finish on the normal clock
+            time.sleep(max(deadline - time.monotonic(), 0))
+    finally:
+        _CloseHandle(timer)
+
+
+def _close_mci_alias() -> None:
+    """Release the MCI alias opened by :func:`open_tray_mci`."""
+
+    _mciSendString(_MCI_CLOSE, None, 0, None)
+
+
+def open_tray_mci() -> bool:
+    """Attempt to open the tray using the Windows MCI API."""
 
-        ctypes.windll.winmm.mciSendStringW(f"set {alias} door open", None, 0, None)
-        ctypes.windll.winmm.mciSendStringW(f"close {alias}", None, 0, None)
+    global _mci_alias_opened
+
+    try:
+        if not _mci_alias_opened:
+            rc = _mciSendString(_MCI_OPEN, None, 0, None)
+            if rc != 0:
+                print(f"MCI open reported error code: {rc}")
+                return False
+            _mci_alias_opened = True
+            atexit.register(_close_mci_alias)
+
+        _mciSendString(_MCI_DOOR, None, 0, None)
         print("Sent eject command via MCI.")
         return True
     except Exception as exc:  # pragma: no cover - Windows-specific
@@ -187,8 +558,12 @@ def open_tray_mci(alias: str = "cd") -> bool:
 
 
 def open_tray_ioctl(drive_letter: str) -> bool:
-    """Attempt to open the tray via IOCTL_STORAGE_EJECT_MEDIA."""
+    """Attempt to open the tray via IOCTL_STORAGE_EJECT_MEDIA (overlapped)."""
+
+    global _pending_eject
 
+    handle = None
+    event = None
     try:
         dl = drive_letter.strip().upper()
         if len(dl) == 1:
@@ -197,28 +572,28 @@ def open_tray_ioctl(drive_letter: str) -> bool:
             dl = dl[:-1]
 
         path = f"\\\\.\\{dl}"
-        kernel32 = ctypes.windll.kernel32
-        GENERIC_READ = 0x80000000
-        FILE_SHARE_READ = 0x00000001
-        FILE_SHARE_WRITE = 0x00000002
-        OPEN_EXISTING = 3
-
-        handle = kernel32.CreateFileW(
+        handle = _CreateFileW(
             path,
             GENERIC_READ,
             FILE_SHARE_READ | FILE_SHARE_WRITE,
             None,
             OPEN_EXISTING,
-            0,
+            FILE_FLAG_OVERLAPPED,
             None,
         )
-        INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
         if handle == INVALID_HANDLE_VALUE:
-            print(f"CreateFile failed for {path}")
+            handle = None
+            print(f"CreateFile failed for {path} (error {ctypes.get_last_error()})")
             return False
 
-        bytes_returned = ctypes.c_ulong()
-        result = kernel32.DeviceIoControl(
+        event = _CreateEventW(None, True, False, None)
+        if not event:
+            print(f"CreateEvent failed (error {ctypes.get_last_error()})")
+            return False
+
+        overlapped = OVERLAPPED(hEvent=event)
+        bytes_returned = wintypes.DWORD()
+        result = _DeviceIoControl(
             handle,
             IOCTL_STORAGE_EJECT_MEDIA,
             None,
@@ -226,33 +601,198 @@ def open_tray_ioctl(drive_letter: str) -> bool:
             None,
             0,
             ctypes.byref(bytes_returned),
-            None,
+            ctypes.byref(overlapped),
         )
-        kernel32.CloseHandle(handle)
+        error = ctypes.get_last_error()
+
+        if not result and error == ERROR_IO_PENDING:
+            # The drive is still spinning down; let wait_for_tray() collect it.
+            _pending_eject = _PendingEject(
+                drive_letter, handle, event, overlapped, bytes_returned
+            )
+            handle = event = None  # Now owned by _pending_eject
+            print("Sent eject command via IOCTL (completing in the background).")
+            return True
+
         if result:
             print("Sent eject command via IOCTL.")
             return True
-        print("DeviceIoControl returned failure.")
+        print(f"DeviceIoControl returned failure (error {error}).")
         return False
     except Exception as exc:  # pragma: no cover - Windows-specific
         print(f"IOCTL method raised exception: {exc}")
         return False
+    finally:
+        if event:
+            _CloseHandle(event)
+        if handle is not None:
+            _CloseHandle(handle)
 
 
-def open_tray(drive_letter: Optional[str]) -> bool:
-    """Open the tray using MCI first, then IOCTL as a fallback."""
+def _load_show_cache() -> dict:
+    """Return the tray settings remembered from previous runs."""
+
+    try:
+        with open(SHOW_CACHE_FILE, encoding="utf-8") as handle:
+            cache = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_show_cache(cache: dict) -> None:
+    """Persist ``cache`` for the next run."""
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(SHOW_CACHE_FILE, "w", encoding="utf-8") as handle:
+            json.dump(cache, handle)
+    except OSError as exc:
+        print(f"Could not save show cache: {exc}")
+
+
+def _remember_tray_method(
+    cache: dict, method: str, drive_letter: Optional[str] = None
+) -> None:
+    """Record the tray method that just worked, writing only when it changed.
+
+    Only an IOCTL success proves which drive is the optical one, so MCI keeps
+    the drive learned earlier.
+    """
+
+    updated = dict(cache, last_method=method)
+    if drive_letter:
+        updated["last_drive"] = drive_letter
+    if updated != cache:
+        _save_show_cache(updated)
+
+
+def _open_tray_fallbacks(
+    cache: dict, drive_letter: Optional[str], tried_drive: Optional[str] = None
+) -> bool:
+    """Open the tray with MCI, then IOCTL on ``drive_letter`` (or the cached drive)."""
 
     if open_tray_mci():
+        _remember_tray_method(cache, "mci")
         return True
 
-    if drive_letter:
-        print(f"Falling back to IOCTL for drive {drive_letter}")
-        return open_tray_ioctl(drive_letter)
+    drive_letter = drive_letter or cache.get("last_drive")
+    if not drive_letter:
+        print("No fallback available (no drive letter).")
+        return False
+    if drive_letter == tried_drive:
+        return False  # Already failed
 
-    print("No fallback available (no drive letter).")
+    print(f"Falling back to IOCTL for drive {drive_letter}")
+    if open_tray_ioctl(drive_letter):
+        _remember_tray_method(cache, "ioctl", drive_letter)
+        return True
     return False
 
 
+def open_tray(drive_letter: Optional[str]) -> bool:
+    """Open the tray, starting with the method that worked last time.
+
+    Without a cached IOCTL success this is MCI first, then IOCTL as a fallback.
+    """
+
+    cache = _load_show_cache()
+    last_drive = cache.get("last_drive")
+    tried_drive = None
+
+    if cache.get("last_method") == "ioctl" and last_drive:
+        print(f"Using cached IOCTL method for drive {last_drive}")
+        if open_tray_ioctl(last_drive):
+            if _pending_eject is not None:
+                # wait_for_tray() falls back to MCI if this completes with an error.
+                _pending_eject.from_cache = True
+            return True
+        tried_drive = last_drive
+
+    return _open_tray_fallbacks(cache, drive_letter, tried_drive)
+
+
+def _finish_pending_eject(pending: _PendingEject) -> bool:
+    """Wait for an overlapped eject IOCTL to complete and release its handles."""
+
+    completed = False
+    try:
+        # Wait in slices so Ctrl+C is not blocked for the whole timeout.
+        deadline = time.monotonic() + IOCTL_EJECT_TIMEOUT_MS / 1000
+        status = _WaitForSingleObject(pending.event, WAIT_SLICE_MS)
+        while status == WAIT_TIMEOUT and time.monotonic() < deadline:
+            status = _WaitForSingleObject(pending.event, WAIT_SLICE_MS)
+        if status != WAIT_OBJECT_0:
+            print("Eject IOCTL timed out; cancelling it.")
+            _CancelIoEx(pending.handle, ctypes.byref(pending.overlapped))
+        # bWait=TRUE also covers the cancelled case, which completes promptly.
+        result = _GetOverlappedResult(
+            pending.handle,
+            ctypes.byref(pending.overlapped),
+            ctypes.byref(pending.bytes_returned),
+            True,
+        )
+        error = ctypes.get_last_error()
+        completed = True
+    finally:
+        if not completed:
+            # Interrupted: the driver must finish with OVERLAPPED before it is freed.
+            _CancelIoEx(pending.handle, ctypes.byref(pending.overlapped))
+            _GetOverlappedResult(
+                pending.handle,
+                ctypes.byref(pending.overlapped),
+                ctypes.byref(pending.bytes_returned),
+                True,
+            )
+        _CloseHandle(pending.event)
+        _CloseHandle(pending.handle)
+
+    if result:
+        print("Eject IOCTL completed.")
+        return True
+    print(f"Eject IOCTL failed (error {error}).")
+    return False
+
+
+def _forget_ioctl_preference() -> None:
+    """Drop a cached IOCTL preference so the next run tries MCI first again."""
+
+    cache = _load_show_cache()
+    if cache.pop("last_method", None) == "ioctl":
+        _save_show_cache(cache)
+
+
+def wait_for_tray(min_wait_seconds: float, drive_letter: Optional[str] = None) -> bool:
+    """Wait for any in-flight eject IOCTL and for at least ``min_wait_seconds``.
+
+    The two waits overlap instead of adding up. If an IOCTL issued from the
+    cached preference fails, MCI and then IOCTL on ``drive_letter`` are tried
+    as :func:`open_tray` would have without the cache. Returns False if the
+    tray could not be opened; a failed IOCTL also drops the cached preference.
+    """
+
+    global _pending_eject
+
+    started = time.monotonic()
+    pending, _pending_eject = _pending_eject, None
+    if pending is not None and not _finish_pending_eject(pending):
+        _forget_ioctl_preference()
+        if not pending.from_cache:
+            return False
+
+        print("Cached IOCTL method failed; trying the other methods...")
+        if not _open_tray_fallbacks(_load_show_cache(), drive_letter, pending.drive_letter):
+            return False
+        started = time.monotonic()  # The tray only started opening now
+        pending, _pending_eject = _pending_eject, None
+        if pending is not None and not _finish_pending_eject(pending):
+            _forget_ioctl_preference()
+            return False
+
+    _precise_sleep(min_wait_seconds - (time.monotonic() - started))
+    return True
+
+
 def infer_drive_letter(video_path: str) -> Optional[str]:
     """Infer the optical drive letter from the video path if possible."""
 
@@ -261,11 +801,25 @@ def infer_drive_letter(video_path: str) -> Optional[str]:
     return None
 
 
-def trigger_arduino_motor(arduino: serial.Serial, command: bytes = b"M") -> None:
-    """Send the motor activation command to the Arduino."""
-
-    arduino.write(command)
-    arduino.flush()
+def trigger_arduino_motor(
+    arduino: Optional[serial.Serial],
+    preferred_port: Optional[str] = None,
+    command: bytes = MOTOR_CMD,
+) -> None:
+    """Send the motor activation command to the Arduino (or to the daemon).
+
+    If the daemon has exited since start-up, its COM port is free again, so
+    the command is sent over a direct connection instead.
+    """
+
+    if arduino is None:
+        if send_via_daemon(command, append_newline=False):
+            return
+        print("Arduino daemon is no longer running; connecting directly.")
+        with _open_arduino(preferred_port) as direct:
+            send_command(direct, command, append_newline=False)
+    else:
+        send_command(arduino, command, append_newline=False)
     print("Motor command sent to Arduino.")
 
 
@@ -278,19 +832,48 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     config = parse_arguments(argv)
 
     arduino: Optional[serial.Serial] = None
-    player: Optional[vlc.MediaPlayer] = None
-    _vlc_instance: Optional[vlc.Instance] = None  # Keep a reference alive while playing
+    player: Optional[libvlc.MediaPlayer] = None
+    vlc_instance: Optional[libvlc.Instance] = None
+    wave_playing = False
 
+    _timeBeginPeriod(TIMER_RESOLUTION_MS)  # 1 ms scheduler ticks for the show
     try:
-        arduino = connect_to_arduino(config.arduino_port)
-
         print(f"Checking for video file: {config.video_path}")
-        _vlc_instance, player = start_video_playback(config.video_path)
-
-        wait_until_video_finishes(player)
+        config.video_path = ensure_video_exists(config.video_path)
+        print("File found.")
+
+        wave_seconds = get_wave_duration(config.video_path)
+        if wave_seconds is not None:
+            # Plain WAV audio: winsound starts instantly and plays in the
+            # background while the Arduino connects, so VLC is not needed.
+            wave_started = time.monotonic()
+            start_wave_playback(config.video_path)
+            wave_playing = True
+            arduino = connect_to_arduino(config.arduino_port)
+            _precise_sleep(wave_seconds - (time.monotonic() - wave_started))
+            wave_playing = False
+            print("Audio playback finished.")
+        else:
+            # Neither step depends on the other, so overlap the Arduino
+            # handshake with VLC start-up. Leaving the ``with`` block waits
+            # for both.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                arduino_future = executor.submit(connect_to_arduino, config.arduino_port)
+                video_future = executor.submit(start_video_playback, config.video_path)
+
+            # Keep whichever side succeeded so ``finally`` can release it, then
+            # re-raise the first failure.
+            if arduino_future.exception() is None:
+                arduino = arduino_future.result()
+            if video_future.exception() is None:
+                vlc_instance, player = video_future.result()
+            arduino_future.result()
+            video_future.result()
+
+            wait_until_video_finishes(player)
 
         print(f"Waiting for margin: {config.margin_seconds} seconds...")
-        time.sleep(config.margin_seconds)
+        _precise_sleep(config.margin_seconds)
 
         drive_letter = infer_drive_letter(config.video_path)
 
@@ -304,9 +887,12 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
                 )
 
             print(f"Waiting {config.eject_wait_seconds} seconds for tray to open...")
-            time.sleep(config.eject_wait_seconds)
+            if not wait_for_tray(config.eject_wait_seconds, drive_letter):
+                raise RuntimeError(
+                    f"The tray eject for drive {drive_letter or 'unknown'} failed."
+                )
 
-            trigger_arduino_motor(arduino)
+            trigger_arduino_motor(arduino, config.arduino_port)
 
     except Exception as exc:
         print("\n" + "=" * 30)
@@ -317,10 +903,17 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     finally:
         print("--- Cleaning up resources ---")
 
-        if player is not None:
+        if wave_playing:
+            try:
+                print("Stopping audio playback...")
+                stop_wave_playback()
+            except Exception:
+                pass
+
+        if vlc_instance is not None:
             try:
                 print("Stopping VLC player...")
-                player.stop()
+                release_video_playback(vlc_instance, player)
             except Exception:
                 pass
 
@@ -331,6 +924,7 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
             except Exception:
                 pass
 
+        _timeEndPeriod(TIMER_RESOLUTION_MS)
         print("Process complete.")
 
 
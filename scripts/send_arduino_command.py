@@ -4,6 +4,9 @@ This script detects an Arduino serial port (Windows) and sends a short
 command string. It is a direct, single-purpose helper intended for
 manual use or small automation tasks.
 
+If ``scripts/arduino_daemon.py`` is running, the command is handed to it over
+a named pipe instead of opening the serial port here.
+
 Usage examples:
   python scripts/send_arduino_command.py --dry-run
   python scripts/send_arduino_command.py --port COM3 --command M
@@ -16,6 +19,11 @@ pip install pyserial
 from __future__ import annotations
 
 import argparse
+import functools
+import json
+import math
+import os
+import re
 import sys
 import time
 from typing import Iterable, Optional
@@ -24,43 +32,291 @@ import serial
 import serial.tools.list_ports
 
 ARDUINO_KEYWORDS: tuple[str, ...] = ("Arduino", "CH340", "USB-SERIAL")
+# (VID, PID) pairs of known boards/adapters; a PID of None matches any product.
+ARDUINO_USB_IDS: frozenset[tuple[int, Optional[int]]] = frozenset(
+    {(0x2341, None), (0x1A86, 0x7523)}  # Arduino SA, CH340
+)
 DEFAULT_BAUDRATE = 9600
 DEFAULT_TIMEOUT = 0.1
+DEFAULT_WRITE_TIMEOUT = 1.0
 RESET_DELAY_SECONDS = 2.0
+READY_QUERY = b"?\n"
+READY_POLL_SECONDS = 0.05
+FTDI_LATENCY_TIMER_MS = 1
+FTDIBUS_KEY = r"SYSTEM\CurrentControlSet\Enum\FTDIBUS"
+PORT_CACHE_TTL_SECONDS = 5.0
+CACHE_DIR = os.path.join(
+    os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), "pre-makaizo"
+)
+LAST_PORT_FILE = os.path.join(CACHE_DIR, "last_port.json")
+DAEMON_PIPE_PATH = r"\\.\pipe\arduino-show-ctrl"
 
+# (timestamp, ports) from the most recent ``comports()`` enumeration.
+_PORT_CACHE: Optional[tuple[float, list]] = None
 
-def find_arduino_port(keywords: Iterable[str] = ARDUINO_KEYWORDS) -> Optional[str]:
-    """Return the most likely COM port that hosts an Arduino device."""
+
+def _compile_keywords(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Build one case-insensitive pattern matching any of ``keywords``."""
+
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+_ARDUINO_RE = _compile_keywords(ARDUINO_KEYWORDS)
+
+
+def _is_arduino_port(port, pattern: re.Pattern[str] = _ARDUINO_RE) -> bool:
+    """Return True if ``port`` looks like an Arduino by USB ID or by name."""
+
+    if port.vid is not None and (
+        (port.vid, port.pid) in ARDUINO_USB_IDS or (port.vid, None) in ARDUINO_USB_IDS
+    ):
+        return True
+    return bool(
+        pattern.search(port.description or "") or pattern.search(port.manufacturer or "")
+    )
+
+
+def _cached_comports(ttl: float = PORT_CACHE_TTL_SECONDS) -> list:
+    """Return ``comports()``, reusing the previous enumeration for ``ttl`` seconds."""
+
+    global _PORT_CACHE
+
+    now = time.monotonic()
+    if _PORT_CACHE is not None and now - _PORT_CACHE[0] < ttl:
+        return _PORT_CACHE[1]
+
+    ports = list(serial.tools.list_ports.comports())
+    _PORT_CACHE = (now, ports)
+    return ports
+
+
+def _load_last_port() -> Optional[str]:
+    """Return the Arduino port remembered from a previous run, if any."""
+
+    try:
+        with open(LAST_PORT_FILE, encoding="utf-8") as handle:
+            return json.load(handle).get("port")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _save_last_port(port: str) -> None:
+    """Remember ``port`` so the next run can skip the enumeration."""
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(LAST_PORT_FILE, "w", encoding="utf-8") as handle:
+            json.dump({"port": port}, handle)
+    except OSError as exc:
+        print(f"Could not save Arduino port cache: {exc}")
+
+
+def _forget_last_port() -> None:
+    """Drop the remembered port, e.g. after its COM name went to another device."""
+
+    try:
+        os.remove(LAST_PORT_FILE)
+    except OSError:
+        pass
+
+
+def _probe_port(port: str) -> bool:
+    """Return True if ``port`` can currently be opened."""
+
+    probe = serial.Serial()
+    probe.port = port
+    probe.dtr = False  # do not reset the board just to check it is there
+    try:
+        probe.open()
+    except serial.SerialException:
+        return False
+    probe.close()
+    return True
+
+
+def _matching_ports(pattern: re.Pattern[str], ttl: float = PORT_CACHE_TTL_SECONDS) -> list[str]:
+    """Return the devices of all enumerated ports that look like an Arduino."""
+
+    return [port.device for port in _cached_comports(ttl) if _is_arduino_port(port, pattern)]
+
+
+def _locate_arduino_port(
+    keywords: Iterable[str] = ARDUINO_KEYWORDS,
+) -> tuple[Optional[str], bool]:
+    """Return ``(port, from_cache)`` for the most likely Arduino COM port."""
+
+    last_port = _load_last_port()
+    if last_port and _probe_port(last_port):
+        print(f"Using cached Arduino port: {last_port}")
+        return last_port, True
+
+    pattern = _ARDUINO_RE if keywords is ARDUINO_KEYWORDS else _compile_keywords(keywords)
 
     print("Searching for Arduino port...")
-    ports = serial.tools.list_ports.comports()
-    for port in ports:
-        if any(keyword in port.description for keyword in keywords):
-            print(f"Found Arduino at: {port.device}")
-            return port.device
+    for device in _matching_ports(pattern):
+        print(f"Found Arduino at: {device}")
+        _save_last_port(device)
+        return device, False
     print("No Arduino-like device was detected.")
-    return None
+    return None, False
+
+
+def find_arduino_port(keywords: Iterable[str] = ARDUINO_KEYWORDS) -> Optional[str]:
+    """Return the most likely COM port that hosts an Arduino device."""
+
+    return _locate_arduino_port(keywords)[0]
+
+
+def wait_for_ready(connection: serial.Serial, timeout: float = RESET_DELAY_SECONDS) -> bool:
+    """Query the sketch until it answers, returning False after ``timeout`` seconds."""
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        connection.reset_input_buffer()
+        connection.write(READY_QUERY)
+        time.sleep(READY_POLL_SECONDS)
+        if connection.in_waiting:
+            connection.reset_input_buffer()
+            return True
+    return False
+
+
+def _set_ftdi_latency_timer(port: str, latency_ms: int = FTDI_LATENCY_TIMER_MS) -> None:
+    """Lower the FTDI driver's latency timer (16 ms by default) for ``port``."""
+
+    import winreg
+
+    hklm = winreg.HKEY_LOCAL_MACHINE
+    try:
+        with winreg.OpenKey(hklm, FTDIBUS_KEY) as bus:
+            device_count = winreg.QueryInfoKey(bus)[0]
+            devices = [winreg.EnumKey(bus, index) for index in range(device_count)]
+    except OSError:
+        return  # No FTDI devices (or driver) on this machine
+
+    for device in devices:
+        params_path = FTDIBUS_KEY + "\\" + device + "\\0000\\Device Parameters"
+        try:
+            with winreg.OpenKey(hklm, params_path) as params:
+                port_name = winreg.QueryValueEx(params, "PortName")[0]
+                current = winreg.QueryValueEx(params, "LatencyTimer")[0]
+        except OSError:
+            continue
+        if port_name != port:
+            continue
+
+        if current > latency_ms:
+            try:
+                with winreg.OpenKey(hklm, params_path, 0, winreg.KEY_SET_VALUE) as params:
+                    winreg.SetValueEx(params, "LatencyTimer", 0, winreg.REG_DWORD, latency_ms)
+                print(f"Lowered FTDI latency timer on {port}: {current} ms -> {latency_ms} ms")
+            except OSError as exc:  # Writing HKLM needs administrator rights
+                print(f"Could not lower FTDI latency timer on {port}: {exc}")
+        return
+
+
+def _open_connection(port: str, baudrate: int, timeout: float) -> serial.Serial:
+    """Open ``port`` without resetting the board."""
+
+    print(f"Opening serial connection to {port} @ {baudrate} baud...")
+    connection = serial.Serial(
+        baudrate=baudrate,
+        timeout=timeout,
+        write_timeout=DEFAULT_WRITE_TIMEOUT,
+        dsrdtr=False,
+        rtscts=False,
+    )
+    _set_ftdi_latency_timer(port)  # must happen before open() to take effect
+    connection.port = port
+    connection.dtr = False  # keep DTR low so opening the port does not reset the board
+    connection.open()
+    return connection
 
 
 def connect_to_arduino(port: str, baudrate: int, timeout: float) -> serial.Serial:
     """Create and return an open serial connection to the Arduino."""
 
-    print(f"Opening serial connection to {port} @ {baudrate} baud...")
-    connection = serial.Serial(port=port, baudrate=baudrate, timeout=timeout)
-    time.sleep(RESET_DELAY_SECONDS)  # allow any auto-reset to complete
+    connection = _open_connection(port, baudrate, timeout)
+    if not wait_for_ready(connection):  # covers boards that reset anyway
+        print("Arduino did not answer the ready query; continuing anyway.")
+    return connection
+
+
+def connect_to_detected_arduino(baudrate: int, timeout: float) -> Optional[serial.Serial]:
+    """Auto-detect the Arduino and connect to it; return None if none is found.
+
+    A cached port is only trusted while it answers the ready query: its COM
+    number may have been reassigned to another device. Otherwise the cache
+    is dropped and the ports are enumerated once more.
+    """
+
+    port, from_cache = _locate_arduino_port()
+    if port is None:
+        return None
+
+    connection = _open_connection(port, baudrate, timeout)
+    if wait_for_ready(connection):  # covers boards that reset anyway
+        return connection
+
+    if from_cache:
+        print(f"No answer from cached port {port}; searching again...")
+        _forget_last_port()
+        # Enumerate afresh (ttl=0) and switch only to a port that answers.
+        for device in _matching_ports(_ARDUINO_RE, ttl=0):
+            if device == port:
+                continue
+            candidate = _open_connection(device, baudrate, timeout)
+            if wait_for_ready(candidate):
+                print(f"Found Arduino at: {device}")
+                _save_last_port(device)
+                connection.close()
+                return candidate
+            candidate.close()
+
+    print("Arduino did not answer the ready query; continuing anyway.")
     return connection
 
 
+def drain_output(arduino: serial.Serial, nbytes: int) -> None:
+    """Wait until the output queue is empty, bounded by the wire time of ``nbytes``."""
+
+    # 10 bits per byte (start + 8 data + stop), plus 1 ms of slack.
+    limit_ms = math.ceil(nbytes * 10 / arduino.baudrate * 1000) + 1
+    deadline = time.monotonic() + limit_ms / 1000
+    while arduino.out_waiting and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
 def send_command(arduino: serial.Serial, payload: bytes, append_newline: bool) -> None:
     """Write ``payload`` (plus optional newline) to the serial connection."""
 
     data = payload + (b"\n" if append_newline else b"")
-    arduino.write(data)
-    arduino.flush()
+    arduino.write(data)  # a single write; flush() would poll out_waiting every 50 ms
+    drain_output(arduino, len(data))
     print(f"Sent {len(data)} bytes to Arduino.")
 
 
-def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
+def send_via_daemon(payload: bytes, append_newline: bool) -> bool:
+    """Hand the command to ``arduino_daemon.py``; return False if it is not running."""
+
+    data = payload + (b"\n" if append_newline else b"")
+    try:
+        # No O_CREAT, so this is an OPEN_EXISTING connect to the daemon's pipe.
+        pipe = os.open(DAEMON_PIPE_PATH, os.O_WRONLY | os.O_BINARY)
+    except OSError:  # FileNotFoundError when no daemon is listening
+        return False
+    try:
+        os.write(pipe, data)
+    except OSError:  # The daemon exited between open and write
+        return False
+    finally:
+        os.close(pipe)
+    print(f"Sent {len(data)} bytes to Arduino via the daemon.")
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     """Build a CLI interface so the script can be reused from a shell."""
 
     parser = argparse.ArgumentParser(
@@ -98,7 +354,13 @@ def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
         help="Show what would happen without opening the port or sending data.",
     )
 
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_arguments(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse ``argv`` with the cached parser from :func:`_build_parser`."""
+
+    return _build_parser().parse_args(argv)
 
 
 def main(argv: Optional[list[str]] = None) -> None:
@@ -120,15 +382,21 @@ def main(argv: Optional[list[str]] = None) -> None:
         )
         return
 
-    port = args.port or find_arduino_port()
-    if port is None:
-        raise SystemExit("Aborting: no Arduino port could be determined.")
+    payload = args.command.encode("utf-8")
+    if send_via_daemon(payload, not args.no_newline):
+        return
 
+    connection: Optional[serial.Serial] = None
     try:
-        connection = connect_to_arduino(port, args.baudrate, args.timeout)
-        send_command(connection, args.command.encode("utf-8"), not args.no_newline)
+        if args.port:
+            connection = connect_to_arduino(args.port, args.baudrate, args.timeout)
+        else:
+            connection = connect_to_detected_arduino(args.baudrate, args.timeout)
+        if connection is None:
+            raise SystemExit("Aborting: no Arduino port could be determined.")
+        send_command(connection, payload, not args.no_newline)
     finally:
-        if "connection" in locals() and connection.is_open:
+        if connection is not None and connection.is_open:
             print("Closing serial connection...")
             connection.close()
 